@@ -0,0 +1,120 @@
+"""
+asyncio client for fbaModelServices. Requires httpx with HTTP/2 support
+(pip install httpx[http2]).
+
+Exposes the same methods as the blocking client in Client.py, as coroutines,
+so many calls can be in flight at once on one event loop, multiplexed over a
+single HTTP/2 connection where the server supports it:
+
+    async with AsyncFbaModelServices(url) as c:
+        results = await asyncio.gather(*[c.get_models(x) for x in xs])
+"""
+
+import asyncio
+import os
+from urllib.parse import urlparse
+
+import httpx
+
+from biokbase.fbaModelServices._rpc import _CT, _AJ, _URL_SCHEME, _METHODS, \
+    _CACHEABLE, _CONNECT_TIMEOUT, _RETRIES, ServerError, _loads, \
+    _make_method, _request_body, _decode_result, _new_cache, _cache_key, \
+    _server_error
+
+
+class AsyncFbaModelServices(object):
+
+    def __init__(self, url=None, timeout=30 * 60, token=None):
+        if url is None:
+            raise ValueError('A url is required')
+        scheme = urlparse(url).scheme
+        if scheme not in _URL_SCHEME:
+            raise ValueError(url + " isn't a valid http url")
+        self.url = url
+        self.timeout = int(timeout)
+        if self.timeout < 1:
+            raise ValueError('Timeout value must be at least 1 second')
+        self._headers = {_CT: _AJ}
+        if token is None:
+            token = os.environ.get('KB_AUTH_TOKEN')
+        if token is not None:
+            self._headers['AUTHORIZATION'] = token
+        self._client = None
+        # raw response bodies of read-only methods, keyed on method + params,
+        # and the requests currently in flight for those keys so concurrent
+        # identical calls share one round trip; any other call clears both
+        # and bumps the generation so reads already in flight don't store
+        # what they fetched before the write
+        self._cache = _new_cache()
+        self._cache_gen = 0
+        self._inflight = {}
+
+    async def __aenter__(self):
+        # httpx only retries failed connection attempts, never a request
+        # that reached the server
+        transport = httpx.AsyncHTTPTransport(
+            http2=True, retries=_RETRIES,
+            limits=httpx.Limits(max_connections=32,
+                                max_keepalive_connections=16))
+        self._client = httpx.AsyncClient(
+            transport=transport, headers=self._headers,
+            timeout=httpx.Timeout(self.timeout, connect=_CONNECT_TIMEOUT))
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _call(self, method, params):
+        if self._cache is None:
+            return _decode_result(await self._post(method, params))
+        if method not in _CACHEABLE:
+            try:
+                return _decode_result(await self._post(method, params))
+            finally:
+                self._invalidate()
+        key = _cache_key(method, params)
+        b = self._cache.get(key)
+        if b is not None:
+            return _decode_result(b)
+        gen = self._cache_gen
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(self._post(method, params))
+            inflight = self._inflight
+            inflight[key] = fut
+            fut.add_done_callback(lambda f: inflight.pop(key, None))
+        b = await asyncio.shield(fut)
+        res = _decode_result(b)
+        if self._cache_gen == gen:
+            self._cache[key] = b
+        return res
+
+    def _invalidate(self):
+        self._cache.clear()
+        self._inflight = {}
+        self._cache_gen += 1
+
+    async def _post(self, method, params):
+        if self._client is None:
+            raise RuntimeError('AsyncFbaModelServices must be used as an ' +
+                               '"async with" context manager')
+        body = _request_body(method, params)
+        ret = await self._client.post(self.url, content=body)
+        if ret.status_code != 200:
+            if ret.headers.get(_CT) == _AJ:
+                err = _loads(ret.content)
+                if isinstance(err, dict) and 'error' in err:
+                    raise _server_error(err['error'])
+                raise ServerError('Unknown', 0, ret.text)
+            ret.raise_for_status()
+        return ret.content
+
+
+# RPC methods, generated from the method table
+for _name, _argnames, _ in _METHODS:
+    setattr(AsyncFbaModelServices, _name, _make_method(_name, _argnames))
@@ -0,0 +1,319 @@
+"""
+JSON-RPC plumbing shared by the blocking (Client) and asyncio (AsyncClient)
+fbaModelServices clients: the method table, request encoding and response
+handling. Kept free of any transport.
+"""
+
+import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import cachetools
+except ImportError:
+    cachetools = None
+
+import os
+import random
+import typing
+
+_CT = 'content-type'
+_AJ = 'application/json'
+_URL_SCHEME = frozenset(['http', 'https'])
+# seconds to wait for a connection; the client timeout bounds the response
+_CONNECT_TIMEOUT = 3.05
+# connection attempts repeated before giving up
+_RETRIES = 3
+
+
+class ServerError(Exception):
+
+    def __init__(self, name, code, message, data=None, error=None):
+        self.name = name
+        self.code = code
+        self.message = '' if message is None else message
+        self.data = data or error or ''
+        # data = JSON RPC 2.0, error = 1.1
+
+    def __str__(self):
+        return self.name + ': ' + str(self.code) + '. ' + self.message + \
+            '\n' + self.data
+
+
+class JSONObjectEncoder(json.JSONEncoder):
+
+    def default(self, obj):
+        if isinstance(obj, set):
+            return list(obj)
+        if isinstance(obj, frozenset):
+            return list(obj)
+        return json.JSONEncoder.default(self, obj)
+
+
+def _orjson_default(obj):
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError('Object of type %s is not JSON serializable' %
+                    type(obj).__name__)
+
+
+# orjson returns bytes, which can be passed straight through as the POST body.
+# Non-string dict keys are stringified as the json module does. NaN and
+# Infinity differ: orjson sends them as null, while json writes the bare NaN /
+# Infinity tokens, which are not valid JSON and strict parsers reject; neither
+# round-trips, so callers should not pass non-finite floats. orjson only
+# encodes ints that fit in 64 bits (and never passes ints to default), so
+# anything it refuses is handed to the json module, which has no such limit.
+# On the way back orjson.loads turns such ints into floats; the msgspec
+# decoder below, when installed, keeps them exact.
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj, default=_orjson_default,
+                                option=_ORJSON_OPTS)
+        except TypeError:
+            return json.dumps(obj, cls=JSONObjectEncoder).encode('utf-8')
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, cls=JSONObjectEncoder).encode('utf-8')
+    _loads = json.loads
+
+
+# (method name, param names, cacheable) for every RPC method exposed by the
+# service; the client methods are generated from this table and take their
+# params positionally or by these names.
+# Cacheable methods are read-only, so their responses may be served from the
+# client's response cache.
+_METHODS = (
+    ('get_models', ('input',), True),
+    ('get_fbas', ('input',), True),
+    ('get_gapfills', ('input',), True),
+    ('get_gapgens', ('input',), True),
+    ('get_reactions', ('input',), True),
+    ('get_compounds', ('input',), True),
+    ('get_alias', ('input',), True),
+    ('get_aliassets', ('input',), True),
+    ('get_media', ('input',), True),
+    ('get_biochemistry', ('input',), True),
+    ('import_probanno', ('input',), False),
+    ('genome_object_to_workspace', ('input',), False),
+    ('genome_to_workspace', ('input',), False),
+    ('domains_to_workspace', ('input',), False),
+    ('compute_domains', ('params',), False),
+    ('add_feature_translation', ('input',), False),
+    ('genome_to_fbamodel', ('input',), False),
+    ('translate_fbamodel', ('input',), False),
+    ('build_pangenome', ('input',), False),
+    ('genome_heatmap_from_pangenome', ('input',), False),
+    ('ortholog_family_from_pangenome', ('input',), False),
+    ('pangenome_to_proteome_comparison', ('input',), False),
+    ('import_fbamodel', ('input',), False),
+    ('export_fbamodel', ('input',), False),
+    ('export_object', ('input',), False),
+    ('export_genome', ('input',), False),
+    ('adjust_model_reaction', ('input',), False),
+    ('adjust_biomass_reaction', ('input',), False),
+    ('addmedia', ('input',), False),
+    ('export_media', ('input',), False),
+    ('runfba', ('input',), False),
+    ('quantitative_optimization', ('input',), False),
+    ('generate_model_stats', ('input',), False),
+    ('minimize_reactions', ('input',), False),
+    ('export_fba', ('input',), False),
+    ('import_phenotypes', ('input',), False),
+    ('simulate_phenotypes', ('input',), False),
+    ('add_media_transporters', ('input',), False),
+    ('export_phenotypeSimulationSet', ('input',), False),
+    ('integrate_reconciliation_solutions', ('input',), False),
+    ('queue_runfba', ('input',), False),
+    ('queue_gapfill_model', ('input',), False),
+    ('gapfill_model', ('input',), False),
+    ('queue_gapgen_model', ('input',), False),
+    ('gapgen_model', ('input',), False),
+    ('queue_wildtype_phenotype_reconciliation', ('input',), False),
+    ('queue_reconciliation_sensitivity_analysis', ('input',), False),
+    ('queue_combine_wildtype_phenotype_reconciliation', ('input',), False),
+    ('run_job', ('input',), False),
+    ('queue_job', ('input',), False),
+    ('set_cofactors', ('input',), False),
+    ('find_reaction_synonyms', ('input',), False),
+    ('role_to_reactions', ('params',), False),
+    ('reaction_sensitivity_analysis', ('input',), False),
+    ('filter_iterative_solutions', ('input',), False),
+    ('delete_noncontributing_reactions', ('input',), False),
+    ('annotate_workspace_Genome', ('params',), False),
+    ('gtf_to_genome', ('params',), False),
+    ('fasta_to_ProteinSet', ('params',), False),
+    ('ProteinSet_to_Genome', ('params',), False),
+    ('fasta_to_ContigSet', ('params',), False),
+    ('ContigSet_to_Genome', ('params',), False),
+    ('probanno_to_genome', ('params',), False),
+    ('get_mapping', ('params',), True),
+    ('subsystem_of_roles', ('params',), False),
+    ('adjust_mapping_role', ('params',), False),
+    ('adjust_mapping_complex', ('params',), False),
+    ('adjust_mapping_subsystem', ('params',), False),
+    ('get_template_model', ('params',), True),
+    ('import_template_fbamodel', ('input',), False),
+    ('adjust_template_reaction', ('params',), False),
+    ('adjust_template_biomass', ('params',), False),
+    ('add_stimuli', ('params',), False),
+    ('import_regulatory_model', ('params',), False),
+    ('compare_models', ('params',), False),
+    ('compare_genomes', ('params',), False),
+    ('import_metagenome_annotation', ('params',), False),
+    ('models_to_community_model', ('params',), False),
+    ('metagenome_to_fbamodels', ('params',), False),
+    ('import_expression', ('input',), False),
+    ('import_regulome', ('input',), False),
+    ('create_promconstraint', ('params',), False),
+    ('add_biochemistry_compounds', ('params',), False),
+    ('update_object_references', ('params',), False),
+    ('add_reactions', ('params',), False),
+    ('remove_reactions', ('params',), False),
+    ('modify_reactions', ('params',), False),
+    ('add_features', ('params',), False),
+    ('remove_features', ('params',), False),
+    ('modify_features', ('params',), False),
+    ('import_trainingset', ('params',), False),
+    ('preload_trainingset', ('params',), False),
+    ('build_classifier', ('params',), False),
+    ('classify_genomes', ('params',), False),
+    ('build_tissue_model', ('params',), False),
+)
+
+_CACHEABLE = frozenset(name for name, _, cacheable in _METHODS if cacheable)
+
+# Response cache tuning; FBA_CACHE_SIZE=0 disables caching, as does running
+# without cachetools installed
+_CACHE_SIZE = int(os.environ.get('FBA_CACHE_SIZE', 1024))
+_CACHE_TTL = float(os.environ.get('FBA_CACHE_TTL', 300))
+
+
+def _new_cache():
+    if cachetools is None or _CACHE_SIZE < 1:
+        return None
+    return cachetools.TTLCache(maxsize=_CACHE_SIZE, ttl=_CACHE_TTL)
+
+
+def _json_cache_key(method, params):
+    return (method, json.dumps(params, cls=JSONObjectEncoder,
+                               sort_keys=True))
+
+
+if orjson is not None:
+    def _cache_key(method, params):
+        try:
+            return (method, orjson.dumps(
+                params, default=_orjson_default,
+                option=_ORJSON_OPTS | orjson.OPT_SORT_KEYS))
+        except TypeError:
+            return _json_cache_key(method, params)
+else:
+    _cache_key = _json_cache_key
+
+
+# Pre-encoded constant head of each method's request body, so a call only
+# has to encode its params and id
+_BODY_PREFIX = dict(
+    (name, b'{"version":"1.1","method":"fbaModelServices.' +
+     name.encode('ascii') + b'","params":[')
+    for name, _, _ in _METHODS)
+
+
+def _bind_params(name, argnames, args, kwargs):
+    if len(args) > len(argnames):
+        raise TypeError('%s() takes exactly %d argument(s) (%d given)' %
+                        (name, len(argnames), len(args)))
+    for argname in sorted(kwargs):
+        if argname not in argnames:
+            raise TypeError("%s() got an unexpected keyword argument '%s'" %
+                            (name, argname))
+        if argname in argnames[:len(args)]:
+            raise TypeError("%s() got multiple values for argument '%s'" %
+                            (name, argname))
+    params = list(args)
+    for argname in argnames[len(args):]:
+        if argname not in kwargs:
+            raise TypeError("%s() missing required argument '%s'" %
+                            (name, argname))
+        params.append(kwargs[argname])
+    return params
+
+
+def _make_method(name, argnames, call='_call'):
+    # Client method that binds its arguments and hands them to
+    # self.<call>(name, params). The async client's _call returns a
+    # coroutine, so the same method is awaitable there.
+    def method(self, *args, **kwargs):
+        params = _bind_params(method.__name__, argnames, args, kwargs)
+        return getattr(self, call)(name, params)
+    method.__name__ = name
+    return method
+
+
+def _request_body(method, params, call_id=None):
+    if call_id is None:
+        call_id = str(random.random())[2:]
+    return b''.join((_BODY_PREFIX[method],
+                     b','.join(_dumps(p) for p in params),
+                     b'],"id":"', call_id.encode('ascii'), b'"}'))
+
+
+def _server_error(error):
+    # ServerError for the error member of a response; a misbehaving server
+    # may send something other than a name/code/message object
+    if isinstance(error, dict):
+        try:
+            return ServerError(**error)
+        except TypeError:
+            pass
+    return ServerError('Unknown', 0, str(error))
+
+
+def _unpack(result, error):
+    # Malformed envelopes are reported as ServerError on both decode paths,
+    # so the exception doesn't depend on whether msgspec is installed
+    if result is not None:
+        if isinstance(result, list) and result:
+            return result[0]
+        raise ServerError('Unknown', 0, 'Malformed result in server response')
+    elif error is not None:
+        raise _server_error(error)
+    else:
+        raise ServerError('Unknown', 0, 'An unknown server error occurred')
+
+
+def _result(resp):
+    if not isinstance(resp, dict):
+        raise ServerError('Unknown', 0, 'Server response is not an object')
+    return _unpack(resp.get('result'), resp.get('error'))
+
+
+# With msgspec the response envelope is decoded straight into a struct rather
+# than a generic dict; the result itself is still decoded as plain objects
+if msgspec is not None:
+    class _RpcResponse(msgspec.Struct):
+        result: typing.Any = None
+        error: typing.Any = None
+
+    _response_decoder = msgspec.json.Decoder(_RpcResponse)
+
+    def _decode_result(b):
+        try:
+            resp = _response_decoder.decode(b)
+        except msgspec.ValidationError:
+            raise ServerError('Unknown', 0,
+                              'Server response is not an object')
+        return _unpack(resp.result, resp.error)
+else:
+    def _decode_result(b):
+        return _result(_loads(b))
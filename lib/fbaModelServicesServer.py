@@ -642,60 +642,73 @@ class Application(object):
                        }
                 rpc_result = self.process_error(err, ctx, {'version': '1.1'})
             else:
-                ctx['module'], ctx['method'] = req['method'].split('.')
-                ctx['call_id'] = req['id']
-                try:
-                    token = environ.get('HTTP_AUTHORIZATION')
-                    # parse out the method being requested and check if it
-                    # has an authentication requirement
-                    auth_req = self.method_authentication.get(req['method'],
-                                                              "none")
-                    if auth_req != "none":
-                        if token is None and auth_req == 'required':
-                            err = ServerError()
-                            err.data = "Authentication required for " + \
-                                "fbaModelServices but no authentication header was passed"
-                            raise err
-                        elif token is None and auth_req == 'optional':
-                            pass
-                        else:
-                            try:
-                                user, _, _ = \
-                                    self.auth_client.validate_token(token)
-                                ctx['user_id'] = user
-                                ctx['authenticated'] = 1
-                                ctx['token'] = token
-                            except Exception, e:
-                                if auth_req == 'required':
-                                    err = ServerError()
-                                    err.data = \
-                                        "Token validation failed: %s" % e
-                                    raise err
-                    # push the context object into the implementation
-                    # instance's namespace
-                    impl_fbaModelServices.ctx = ctx
-                    self.log(log.INFO, ctx, 'start method')
-                    rpc_result = self.rpc_service.call(request_body)
-                    self.log(log.INFO, ctx, 'end method')
-                except JSONRPCError as jre:
-                    err = {'error': {'code': jre.code,
-                                     'name': jre.message,
-                                     'message': jre.data
+                if not isinstance(req, dict):
+                    # batch (array) requests would bypass the per-call auth
+                    # and context handling below, so refuse them before any
+                    # method runs
+                    err = {'error': {'code': -32600,
+                                     'name': 'Invalid Request',
+                                     'message': 'Batch requests are not ' +
+                                        'supported',
                                      }
                            }
-                    trace = jre.trace if hasattr(jre, 'trace') else None
-                    rpc_result = self.process_error(err, ctx, req, trace)
-                except Exception, e:
-                    err = {'error': {'code': 0,
-                                     'name': 'Unexpected Server Error',
-                                     'message': 'An unexpected server error ' +
-                                        'occurred',
-                                     }
-                           }
-                    rpc_result = self.process_error(err, ctx, req,
-                                                    traceback.format_exc())
+                    rpc_result = self.process_error(err, ctx,
+                                                    {'version': '1.1'})
                 else:
-                    status = '200 OK'
+                    ctx['module'], ctx['method'] = req['method'].split('.')
+                    ctx['call_id'] = req['id']
+                    try:
+                        token = environ.get('HTTP_AUTHORIZATION')
+                        # parse out the method being requested and check if it
+                        # has an authentication requirement
+                        auth_req = self.method_authentication.get(req['method'],
+                                                                  "none")
+                        if auth_req != "none":
+                            if token is None and auth_req == 'required':
+                                err = ServerError()
+                                err.data = "Authentication required for " + \
+                                    "fbaModelServices but no authentication header was passed"
+                                raise err
+                            elif token is None and auth_req == 'optional':
+                                pass
+                            else:
+                                try:
+                                    user, _, _ = \
+                                        self.auth_client.validate_token(token)
+                                    ctx['user_id'] = user
+                                    ctx['authenticated'] = 1
+                                    ctx['token'] = token
+                                except Exception, e:
+                                    if auth_req == 'required':
+                                        err = ServerError()
+                                        err.data = \
+                                            "Token validation failed: %s" % e
+                                        raise err
+                        # push the context object into the implementation
+                        # instance's namespace
+                        impl_fbaModelServices.ctx = ctx
+                        self.log(log.INFO, ctx, 'start method')
+                        rpc_result = self.rpc_service.call(request_body)
+                        self.log(log.INFO, ctx, 'end method')
+                    except JSONRPCError as jre:
+                        err = {'error': {'code': jre.code,
+                                         'name': jre.message,
+                                         'message': jre.data
+                                         }
+                               }
+                        trace = jre.trace if hasattr(jre, 'trace') else None
+                        rpc_result = self.process_error(err, ctx, req, trace)
+                    except Exception, e:
+                        err = {'error': {'code': 0,
+                                         'name': 'Unexpected Server Error',
+                                         'message': 'An unexpected server error ' +
+                                            'occurred',
+                                         }
+                               }
+                        rpc_result = self.process_error(err, ctx, req,
+                                                        traceback.format_exc())
+                    else:
+                        status = '200 OK'
 
         #print 'The request method was %s\n' % environ['REQUEST_METHOD']
         #print 'The environment dictionary is:\n%s\n' % pprint.pformat(environ)
@@ -4,7 +4,6 @@ compile_typespec \
 	-psgi fbaModelServices.psgi \
 	-client Bio::KBase::fbaModelServices::Client \
 	-js javascript/fbaModelServices/Client \
-	-py biokbase/fbaModelServices/Client \
 	fbaModelServices.spec lib
 
 
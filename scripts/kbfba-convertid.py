@@ -13,9 +13,10 @@ parser = optparse.OptionParser(usage=usage, description=description)
 (options, args) = parser.parse_args()
 
 if len(args) < 4:
-    p = subprocess.Popen(["python", sys.argv[0], "-h"], stdout=subprocess.PIPE)
+    p = subprocess.Popen([sys.executable, sys.argv[0], "-h"],
+                         stdout=subprocess.PIPE, universal_newlines=True)
     stdout, stderr = p.communicate()
-    print stdout
+    print(stdout)
     exit(1)
 
 fbaClient = fbaModelServices("http://localhost:7036")
@@ -29,4 +30,4 @@ input_params = { "object_type" : args[0],
 aliaslist = fbaClient.get_alias(input_params)
 
 for aliases in aliaslist:
-    print aliases
+    print(aliases)
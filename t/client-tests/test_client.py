@@ -0,0 +1,377 @@
+"""
+Tests for the Python client, mostly run against a local mock server:
+
+    python3 t/client-tests/test_client.py
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'lib'))
+
+import requests  # noqa: E402
+from biokbase.fbaModelServices import _rpc  # noqa: E402
+from biokbase.fbaModelServices.Client import fbaModelServices, \
+    ServerError, ijson  # noqa: E402
+try:
+    from biokbase.fbaModelServices.AsyncClient import AsyncFbaModelServices
+except ImportError:
+    AsyncFbaModelServices = None
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['content-length'])))
+        self.server.requests.append(body)
+        status, ctype, out = self.server.respond(body)
+        self.send_response(status)
+        self.send_header('content-type', ctype)
+        self.send_header('content-length', str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args):
+        pass
+
+
+def _reply(body):
+    # answer one call by echoing its params back as the result
+    return {'version': '1.1', 'id': body['id'], 'result': body['params']}
+
+
+def _json(status, obj):
+    return status, 'application/json', json.dumps(obj).encode('utf-8')
+
+
+def _refuse_batches(body):
+    if isinstance(body, list):
+        return _json(500, {'version': '1.1', 'error': {
+            'code': -32600, 'name': 'Invalid Request',
+            'message': 'Batch requests are not supported'}})
+    return _json(200, _reply(body))
+
+
+class _ServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.requests = []
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.url = 'http://127.0.0.1:%d' % self.server.server_port
+        self.client = fbaModelServices(self.url, ignore_authrc=True)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class BatchTest(_ServerTest):
+
+    def _batch(self):
+        with self.client.batch() as b:
+            futs = [b.get_models({'id': 1}), b.addmedia({'id': 2})]
+        return futs
+
+    def test_batch(self):
+        self.server.respond = lambda body: _json(
+            200, [_reply(call) for call in reversed(body)])
+        models, media = self._batch()
+        self.assertEqual(models.result(), {'id': 1})
+        self.assertEqual(media.result(), {'id': 2})
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_call_errors(self):
+        self.server.respond = lambda body: _json(200, [
+            {'version': '1.1', 'id': body[0]['id'], 'error': {
+                'code': -32500, 'name': 'JSONRPCError', 'message': 'nope'}},
+            'junk'])
+        models, media = self._batch()
+        self.assertRaisesRegex(ServerError, 'nope', models.result)
+        self.assertRaisesRegex(ServerError, 'No response', media.result)
+
+    def test_malformed_call_responses(self):
+        # each malformed element fails only its own call
+        self.server.respond = lambda body: _json(200, [
+            {'id': body[0]['id'], 'error': 'string err'},
+            _reply(body[1])])
+        models, media = self._batch()
+        self.assertRaisesRegex(ServerError, 'string err', models.result)
+        self.assertEqual(media.result(), {'id': 2})
+        self.server.respond = lambda body: _json(200, [
+            {'id': body[0]['id'], 'result': []}, {'id': ['x']},
+            _reply(body[1])])
+        models, media = self._batch()
+        self.assertRaises(ServerError, models.result)
+        self.assertEqual(media.result(), {'id': 2})
+
+    def test_body_raises(self):
+        with self.assertRaises(KeyError):
+            with self.client.batch() as b:
+                fut = b.get_models({'id': 1})
+                raise KeyError('x')
+        self.assertTrue(fut.cancelled())
+        self.assertEqual(self.server.requests, [])
+
+    def test_refused(self):
+        self.server.respond = _refuse_batches
+        models, media = self._batch()
+        self.assertEqual(models.result(), {'id': 1})
+        self.assertEqual(media.result(), {'id': 2})
+        self.assertEqual(len(self.server.requests), 3)
+        # later batches go straight to one call at a time
+        self._batch()
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_refused_4xx(self):
+        self.server.respond = lambda body: (
+            (400, 'text/plain', b'bad request') if isinstance(body, list)
+            else _json(200, _reply(body)))
+        models, media = self._batch()
+        self.assertEqual(media.result(), {'id': 2})
+        self.assertEqual(len(self.server.requests), 3)
+
+    def _assert_fails(self, exc):
+        with self.assertRaises(exc):
+            with self.client.batch() as b:
+                futs = [b.get_models({'id': 1}), b.addmedia({'id': 2})]
+        for fut in futs:
+            self.assertRaises(exc, fut.result, 0)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_server_failure_not_replayed(self):
+        self.server.respond = lambda body: (502, 'text/html', b'bad gateway')
+        self._assert_fails(requests.HTTPError)
+
+    def test_not_json(self):
+        self.server.respond = lambda body: (200, 'text/html', b'<html>')
+        self._assert_fails(ValueError)
+
+    def test_not_a_list(self):
+        self.server.respond = lambda body: _json(200, {'version': '1.1'})
+        self._assert_fails(ServerError)
+
+    def test_connection_refused(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        self.client.close()
+        self.client = fbaModelServices('http://127.0.0.1:%d' % port,
+                                       ignore_authrc=True)
+        with self.assertRaises(requests.ConnectionError):
+            with self.client.batch() as b:
+                fut = b.get_models({'id': 1})
+        self.assertRaises(requests.ConnectionError, fut.result, 0)
+
+
+@unittest.skipIf(ijson is None, 'iter_result requires ijson')
+class IterResultTest(_ServerTest):
+
+    def _iter(self, resp, method='get_models'):
+        self.server.respond = lambda body: _json(200, resp)
+        return list(self.client.iter_result(method, {'id': 1}))
+
+    def test_items(self):
+        self.assertEqual(self._iter({'result': [[1, {'a': [2, {}]}, [[]]]]}),
+                         [1, {'a': [2, {}]}, [[]]])
+        self.assertEqual(self._iter({'result': [[]]}), [])
+        self.assertEqual(self.server.requests[0]['params'], [{'id': 1}])
+
+    def test_only_first_result(self):
+        self.assertEqual(self._iter({'result': [[1, 2], [3]]}), [1, 2])
+
+    def test_error(self):
+        self.assertRaisesRegex(ServerError, 'x: 1. boom', self._iter, {
+            'error': {'name': 'x', 'code': 1, 'message': 'boom'}})
+        self.assertRaisesRegex(ServerError, 'string err', self._iter,
+                               {'result': None, 'error': 'string err'})
+
+    def test_not_a_list(self):
+        self.assertRaisesRegex(ServerError, 'not a list', self._iter,
+                               {'result': [{'a': 1}]})
+        self.assertRaisesRegex(ServerError, 'not a list', self._iter,
+                               {'result': {'a': 1}})
+
+    def test_no_result(self):
+        self.assertRaisesRegex(ServerError, 'unknown server error',
+                               self._iter, {'version': '1.1'})
+        self.assertRaisesRegex(ServerError, 'unknown server error',
+                               self._iter, {'result': []})
+
+    def test_bad_call(self):
+        self.assertRaises(ValueError, self.client.iter_result, 'no_such')
+        self.assertRaises(TypeError, self.client.iter_result, 'get_models')
+        self.assertRaises(TypeError, self.client.iter_result, 'get_models',
+                          1, 2)
+        self.assertEqual(self.server.requests, [])
+
+    def test_keyword(self):
+        self.server.respond = lambda body: _json(200, {'result': [[1]]})
+        self.assertEqual(list(self.client.iter_result(
+            'get_models', input={'id': 1})), [1])
+        self.assertEqual(self.server.requests[0]['params'], [{'id': 1}])
+
+    def test_write_clears_cache(self):
+        if self.client._cache is None:
+            self.skipTest('response cache is disabled')
+        self.server.respond = lambda body: _json(200, {'result': [[1]]})
+        self.client.get_models({'id': 1})
+        self.client.get_models({'id': 1})
+        self.assertEqual(len(self.server.requests), 1)
+        list(self.client.iter_result('addmedia', {'id': 1}))
+        self.client.get_models({'id': 1})
+        self.assertEqual(len(self.server.requests), 3)
+
+
+class _CacheTest(_ServerTest):
+
+    def setUp(self):
+        super().setUp()
+        if self.client._cache is None:
+            self.skipTest('response cache is disabled')
+        # get_models calls wait for the gate before the server answers
+        self.gate = threading.Event()
+        self.gate.set()
+
+        def respond(body):
+            if body['method'].endswith('get_models'):
+                self.gate.wait(10)
+            return _json(200, _reply(body))
+        self.server.respond = respond
+
+    def tearDown(self):
+        self.gate.set()
+        super().tearDown()
+
+    def _wait_for_requests(self, n):
+        deadline = time.time() + 10
+        while len(self.server.requests) < n and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.server.requests), n)
+
+
+class CacheTest(_CacheTest):
+
+    def test_write_clears_cache(self):
+        self.assertEqual(self.client.get_models({'id': 1}), {'id': 1})
+        self.assertEqual(self.client.get_models({'id': 1}), {'id': 1})
+        self.assertEqual(len(self.server.requests), 1)
+        self.client.addmedia({'id': 2})
+        self.client.get_models({'id': 1})
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_read_during_write_not_stored(self):
+        self.gate.clear()
+        read = self.client.submit_get_models({'id': 1})
+        self._wait_for_requests(1)
+        self.client.addmedia({'id': 2})
+        self.gate.set()
+        self.assertEqual(read.result(10), {'id': 1})
+        # the read started before the write, so its response isn't cached
+        self.client.get_models({'id': 1})
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_concurrent_reads_share_request(self):
+        self.gate.clear()
+        futs = [self.client.submit_get_models({'id': 1}) for _ in range(10)]
+        self._wait_for_requests(1)
+        time.sleep(0.2)
+        self.gate.set()
+        self.assertEqual([f.result(10) for f in futs], [{'id': 1}] * 10)
+        self.assertEqual(len(self.server.requests), 1)
+
+
+@unittest.skipIf(AsyncFbaModelServices is None, 'AsyncClient requires httpx')
+class AsyncCacheTest(_CacheTest):
+
+    def _run(self, test):
+        async def run():
+            async with AsyncFbaModelServices(self.url) as client:
+                await test(client)
+        asyncio.run(run())
+
+    async def _wait_for_requests_async(self, n):
+        deadline = time.time() + 10
+        while len(self.server.requests) < n and time.time() < deadline:
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(self.server.requests), n)
+
+    def test_write_clears_cache(self):
+        async def test(client):
+            await client.get_models({'id': 1})
+            await client.get_models({'id': 1})
+            self.assertEqual(len(self.server.requests), 1)
+            await client.addmedia({'id': 2})
+            await client.get_models({'id': 1})
+            self.assertEqual(len(self.server.requests), 3)
+        self._run(test)
+
+    def test_read_during_write_not_stored(self):
+        async def test(client):
+            self.gate.clear()
+            read = asyncio.ensure_future(client.get_models({'id': 1}))
+            await self._wait_for_requests_async(1)
+            await client.addmedia({'id': 2})
+            self.gate.set()
+            self.assertEqual(await read, {'id': 1})
+            await client.get_models({'id': 1})
+            self.assertEqual(len(self.server.requests), 3)
+        self._run(test)
+
+    def test_concurrent_reads_share_request(self):
+        async def test(client):
+            res = await asyncio.gather(
+                *[client.get_models({'id': 1}) for _ in range(10)])
+            self.assertEqual(res, [{'id': 1}] * 10)
+            self.assertEqual(len(self.server.requests), 1)
+        self._run(test)
+
+
+class DecodeTest(unittest.TestCase):
+
+    # each response body with the result, or the error, the decoders
+    # should give for it
+    CASES = (
+        (b'{"result": [5]}', 5),
+        (b'{"result": null}', 'unknown server error'),
+        (b'{"result": []}', 'Malformed result'),
+        (b'{"result": {"a": 1}}', 'Malformed result'),
+        (b'{"error": {"name": "x", "code": 1, "message": "m"}}', 'x: 1. m'),
+        (b'{"error": "string err"}', 'string err'),
+        (b'{"error": {"foo": 1}}', 'foo'),
+        (b'{}', 'unknown server error'),
+        (b'[1]', 'not an object'),
+    )
+
+    def test_decoders_agree(self):
+        # _decode_result uses msgspec when it's installed; _result is the
+        # path without it, and the one batches use
+        decoders = (_rpc._decode_result,
+                    lambda b: _rpc._result(_rpc._loads(b)))
+        for body, expected in self.CASES:
+            for decode in decoders:
+                with self.subTest(body=body, decode=decode):
+                    if isinstance(expected, str):
+                        self.assertRaisesRegex(ServerError, expected,
+                                               decode, body)
+                    else:
+                        self.assertEqual(decode(body), expected)
+            for decode in decoders:
+                self.assertRaises(ValueError, decode, b'not json')
+
+
+if __name__ == '__main__':
+    unittest.main()